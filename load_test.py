@@ -0,0 +1,684 @@
+import os
+import sys
+import io
+import glob
+import json
+import math
+import time
+import random
+import statistics
+import argparse
+import threading
+import uuid
+import urllib.parse
+import urllib.request
+import urllib.error
+import http.cookiejar
+from concurrent.futures import ThreadPoolExecutor
+
+ENDPOINTS = ['/upload_job_description', '/upload_resumes', '/export_csv']
+
+# With nearest-rank, p95 of fewer than 20 samples is just the maximum
+MIN_P95_SAMPLES = 20
+DEFAULT_LATENCY_TOLERANCE_MS = 10.0
+
+DEFAULT_SCENARIO = {
+    'name': 'default',
+    'target': 'local',
+    'sessions': 4,
+    'iterations': 3,
+    'resumes_per_batch': 5,
+    'resume_words': 250,
+    'think_time': 0.0,
+    'seed': 42
+}
+
+# Vocabulary used to build synthetic resumes and job descriptions
+SKILLS = [
+    'python', 'java', 'javascript', 'react', 'angular', 'node', 'sql', 'mongodb',
+    'aws', 'azure', 'docker', 'kubernetes', 'machine learning', 'data science',
+    'flask', 'django', 'spring', 'html', 'css', 'git', 'agile', 'scrum'
+]
+FILLER = [
+    'developed', 'designed', 'implemented', 'maintained', 'led', 'team', 'project',
+    'experience', 'years', 'application', 'service', 'platform', 'customer',
+    'performance', 'scalable', 'backend', 'frontend', 'pipeline', 'analysis',
+    'deployment', 'testing', 'architecture', 'production', 'engineer', 'software'
+]
+
+
+class ResumeGenerator:
+    def __init__(self, seed=None):
+        self.random = random.Random(seed)
+
+    def job_description(self):
+        """Generate a job description mentioning a handful of skills"""
+        skills = self.random.sample(SKILLS, 6)
+        return ('We are hiring a software engineer with strong experience in '
+                + ', '.join(skills) + '. '
+                + ' '.join(self.random.choice(FILLER) for _ in range(60)))
+
+    def resume(self, words):
+        """Generate resume text of roughly the given word count"""
+        tokens = []
+        for _ in range(words):
+            if self.random.random() < 0.15:
+                tokens.append(self.random.choice(SKILLS))
+            else:
+                tokens.append(self.random.choice(FILLER))
+        return 'Candidate Resume\n' + ' '.join(tokens)
+
+    def batch(self, count, words):
+        """Generate a batch of (filename, bytes) resume uploads"""
+        return [
+            ('resume_%08x.txt' % self.random.getrandbits(32), self.resume(words).encode('utf-8'))
+            for _ in range(count)
+        ]
+
+
+class LocalSession:
+    """Recruiter session backed by the Flask test client (in-process)"""
+
+    def __init__(self, app):
+        self.client = app.test_client()
+
+    def post_form(self, path, fields):
+        response = self.client.post(path, data=fields)
+        response.get_data()
+        return response.status_code
+
+    def post_files(self, path, field, files):
+        data = {field: [(io.BytesIO(content), name) for name, content in files]}
+        response = self.client.post(path, data=data, content_type='multipart/form-data')
+        response.get_data()
+        return response.status_code
+
+    def get(self, path):
+        response = self.client.get(path)
+        response.get_data()
+        return response.status_code
+
+
+class HttpSession:
+    """Recruiter session talking to a running server over HTTP"""
+
+    def __init__(self, base_url, timeout=60):
+        self.base_url = base_url.rstrip('/')
+        self.timeout = timeout
+        self.opener = urllib.request.build_opener(
+            urllib.request.HTTPCookieProcessor(http.cookiejar.CookieJar()))
+
+    def _send(self, req):
+        try:
+            with self.opener.open(req, timeout=self.timeout) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as e:
+            e.read()
+            return e.code
+
+    def post_form(self, path, fields):
+        body = urllib.parse.urlencode(fields).encode('utf-8')
+        req = urllib.request.Request(self.base_url + path, data=body, method='POST')
+        req.add_header('Content-Type', 'application/x-www-form-urlencoded')
+        return self._send(req)
+
+    def post_files(self, path, field, files):
+        boundary = uuid.uuid4().hex
+        body = io.BytesIO()
+        for name, content in files:
+            body.write(('--%s\r\n' % boundary).encode('utf-8'))
+            body.write(('Content-Disposition: form-data; name="%s"; filename="%s"\r\n'
+                        % (field, name)).encode('utf-8'))
+            body.write(b'Content-Type: text/plain\r\n\r\n')
+            body.write(content)
+            body.write(b'\r\n')
+        body.write(('--%s--\r\n' % boundary).encode('utf-8'))
+        req = urllib.request.Request(self.base_url + path, data=body.getvalue(), method='POST')
+        req.add_header('Content-Type', 'multipart/form-data; boundary=%s' % boundary)
+        return self._send(req)
+
+    def get(self, path):
+        return self._send(urllib.request.Request(self.base_url + path))
+
+
+def read_rss_kb(pid):
+    """Read the resident set size of a process in KB (Linux only)"""
+    try:
+        with open('/proc/%d/status' % pid) as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1])
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def child_pids(pid):
+    """Read the PIDs of a process's direct children (Linux only)"""
+    children = []
+    for path in glob.glob('/proc/%d/task/*/children' % pid):
+        try:
+            with open(path) as f:
+                children.extend(int(child) for child in f.read().split())
+        except (OSError, ValueError):
+            pass
+    return children
+
+
+def process_tree(pids):
+    """Expand root PIDs to include every descendant process"""
+    found = []
+    pending = list(pids)
+    while pending:
+        pid = pending.pop(0)
+        if pid not in found:
+            found.append(pid)
+            pending.extend(child_pids(pid))
+    return found
+
+
+class MemorySampler(threading.Thread):
+    """Periodically sample the memory of a set of processes and their children
+
+    Children are rediscovered on every sample, so gunicorn workers or the
+    Flask reloader's serving process are picked up from their parent PID.
+    """
+
+    def __init__(self, pids, label, interval=0.2):
+        super().__init__(daemon=True)
+        self.pids = pids
+        self.label = label
+        self.interval = interval
+        # Taken before any load so growth can be reported separately
+        self.baseline = self.sample()
+        self.samples = []
+        self._stop_event = threading.Event()
+
+    def sample(self):
+        """Return {pid: rss_kb} for every live process in the tree"""
+        rss = {}
+        for pid in process_tree(self.pids):
+            kb = read_rss_kb(pid)
+            if kb is not None:
+                rss[pid] = kb
+        return rss
+
+    def run(self):
+        while not self._stop_event.is_set():
+            rss = self.sample()
+            if rss:
+                self.samples.append(rss)
+            self._stop_event.wait(self.interval)
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+        rss = self.sample()
+        if rss:
+            self.samples.append(rss)
+
+    def summary(self):
+        if not self.samples:
+            return None
+        processes = {}
+        for pid in sorted(set(pid for sample in self.samples for pid in sample)):
+            values = [sample[pid] for sample in self.samples if pid in sample]
+            baseline = self.baseline.get(pid, values[0])
+            processes[str(pid)] = {
+                'baseline_mb': round(baseline / 1024, 1),
+                'end_mb': round(values[-1] / 1024, 1),
+                'peak_mb': round(max(values) / 1024, 1)
+            }
+        totals = [sum(sample.values()) for sample in self.samples]
+        baseline = sum(self.baseline.values()) if self.baseline else totals[0]
+        return {
+            'process': self.label,
+            'baseline_mb': round(baseline / 1024, 1),
+            'growth_mb': round((max(totals) - baseline) / 1024, 1),
+            'end_mb': round(totals[-1] / 1024, 1),
+            'peak_mb': round(max(totals) / 1024, 1),
+            'processes': processes
+        }
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of values"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = max(0, int(math.ceil(pct / 100.0 * len(ordered))) - 1)
+    return ordered[min(index, len(ordered) - 1)]
+
+
+class LoadTest:
+    def __init__(self, scenario, session_factory):
+        self.scenario = scenario
+        self.session_factory = session_factory
+        self.lock = threading.Lock()
+        self.records = []
+
+    def _timed(self, endpoint, call, *args):
+        """Run a request, recording its latency and outcome"""
+        start = time.perf_counter()
+        try:
+            status = call(*args)
+        except Exception as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter() - start
+        with self.lock:
+            self.records.append((endpoint, elapsed, status))
+        return status
+
+    def run_session(self, index):
+        """Simulate one recruiter: save a JD, then upload batches and export"""
+        scenario = self.scenario
+        generator = ResumeGenerator(scenario['seed'] + index)
+        session = self.session_factory()
+
+        status = self._timed('/upload_job_description', session.post_form,
+                             '/upload_job_description',
+                             {'job_description': generator.job_description()})
+        if status != 200:
+            # The remaining requests can't run without a job description; record
+            # them as failures so the shortfall shows up in the report
+            with self.lock:
+                for _ in range(scenario['iterations']):
+                    self.records.append(('/upload_resumes', None, 'skipped'))
+                    self.records.append(('/export_csv', None, 'skipped'))
+            return
+
+        for _ in range(scenario['iterations']):
+            batch = generator.batch(scenario['resumes_per_batch'], scenario['resume_words'])
+            self._timed('/upload_resumes', session.post_files,
+                        '/upload_resumes', 'resumes', batch)
+            self._timed('/export_csv', session.get, '/export_csv')
+            if scenario['think_time']:
+                time.sleep(scenario['think_time'])
+
+    def warmup(self):
+        """Run one unmeasured batch per session so cold caches don't skew results"""
+        scenario = self.scenario
+        self.scenario = dict(scenario, iterations=1, think_time=0.0)
+        try:
+            self.run()
+        finally:
+            self.scenario = scenario
+            self.records = []
+
+    def run(self):
+        self.records = []
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.scenario['sessions']) as executor:
+            list(executor.map(self.run_session, range(self.scenario['sessions'])))
+        return time.perf_counter() - start
+
+    def report(self, duration):
+        """Aggregate recorded requests into per-endpoint statistics
+
+        Throughput and latency only count successful (200) requests; failed
+        and skipped requests show up in the error counts instead.
+        """
+        endpoints = {}
+        for endpoint in ENDPOINTS:
+            records = [r for r in self.records if r[0] == endpoint]
+            if not records:
+                continue
+            latencies = [r[1] * 1000 for r in records if r[2] == 200]
+            errors = {}
+            for _, _, status in records:
+                if status != 200:
+                    errors[str(status)] = errors.get(str(status), 0) + 1
+            latency = None
+            if latencies:
+                latency = {
+                    'mean': round(sum(latencies) / len(latencies), 2),
+                    'p50': round(percentile(latencies, 50), 2),
+                    'p90': round(percentile(latencies, 90), 2),
+                    'p95': round(percentile(latencies, 95), 2),
+                    'p99': round(percentile(latencies, 99), 2),
+                    'max': round(max(latencies), 2)
+                }
+            endpoints[endpoint] = {
+                'requests': len(records),
+                'successful': len(latencies),
+                'latency_samples': len(latencies),
+                'rps': round(len(latencies) / duration, 2) if duration else 0.0,
+                'error_rate': round(sum(errors.values()) / len(records), 4),
+                'errors': errors,
+                'latency_ms': latency
+            }
+
+        scenario = self.scenario
+        total = len(self.records)
+        successful = sum(1 for r in self.records if r[2] == 200)
+        return {
+            'scenario': scenario,
+            'runs': 1,
+            'duration_s': round(duration, 3),
+            'planned_requests': scenario['sessions'] * (1 + 2 * scenario['iterations']),
+            'completed_requests': sum(1 for r in self.records if r[2] != 'skipped'),
+            'successful_requests': successful,
+            'rps': round(successful / duration, 2) if duration else 0.0,
+            'error_rate': round((total - successful) / total, 4) if total else 0.0,
+            'endpoints': endpoints
+        }
+
+
+def combine_reports(reports):
+    """Merge repeated runs, taking the median of per-run throughput and latency
+
+    Counts and error rates are pooled across runs. latency_samples is the
+    smallest per-run sample count, since each median p95 comes from one run.
+    """
+    if len(reports) == 1:
+        return reports[0]
+
+    endpoints = {}
+    for endpoint in ENDPOINTS:
+        runs = [r['endpoints'][endpoint] for r in reports if endpoint in r['endpoints']]
+        if not runs:
+            continue
+        requests = sum(e['requests'] for e in runs)
+        errors = {}
+        for e in runs:
+            for status, count in e['errors'].items():
+                errors[status] = errors.get(status, 0) + count
+        latencies = [e['latency_ms'] for e in runs if e['latency_ms']]
+        latency = None
+        if latencies:
+            latency = {key: round(statistics.median(l[key] for l in latencies), 2)
+                       for key in latencies[0]}
+        endpoints[endpoint] = {
+            'requests': requests,
+            'successful': sum(e['successful'] for e in runs),
+            'latency_samples': min(e['latency_samples'] for e in runs),
+            'rps': round(statistics.median(e['rps'] for e in runs), 2),
+            'error_rate': round(sum(errors.values()) / requests, 4) if requests else 0.0,
+            'errors': errors,
+            'latency_ms': latency
+        }
+
+    total = sum(e['requests'] for e in endpoints.values())
+    successful = sum(r['successful_requests'] for r in reports)
+    return {
+        'scenario': reports[0]['scenario'],
+        'runs': len(reports),
+        'duration_s': round(sum(r['duration_s'] for r in reports), 3),
+        'planned_requests': sum(r['planned_requests'] for r in reports),
+        'completed_requests': sum(r['completed_requests'] for r in reports),
+        'successful_requests': successful,
+        'rps': round(statistics.median(r['rps'] for r in reports), 2),
+        'error_rate': round((total - successful) / total, 4) if total else 0.0,
+        'endpoints': endpoints
+    }
+
+
+def load_scenario(path, overrides):
+    """Merge defaults, a saved scenario file and command line overrides"""
+    scenario = dict(DEFAULT_SCENARIO)
+    if path:
+        with open(path, encoding='utf-8') as f:
+            scenario.update(json.load(f))
+    scenario.update({k: v for k, v in overrides.items() if v is not None})
+    return scenario
+
+
+def validate_scenario(scenario):
+    """Return a list of problems with a merged scenario (empty if valid)"""
+    problems = []
+    for key in ('sessions', 'iterations', 'resumes_per_batch', 'resume_words'):
+        value = scenario.get(key)
+        if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+            problems.append('%s must be a positive integer (got %r)' % (key, value))
+    think_time = scenario.get('think_time')
+    if isinstance(think_time, bool) or not isinstance(think_time, (int, float)) or think_time < 0:
+        problems.append('think_time must be a non-negative number (got %r)' % (think_time,))
+    if isinstance(scenario.get('seed'), bool) or not isinstance(scenario.get('seed'), int):
+        problems.append('seed must be an integer (got %r)' % (scenario.get('seed'),))
+    return problems
+
+
+def validate_report(report):
+    """Return a list of problems with a saved report used as a baseline"""
+    if not isinstance(report, dict):
+        return ['expected a JSON object saved with --save']
+    problems = []
+    for key in ('scenario', 'endpoints'):
+        if not isinstance(report.get(key), dict):
+            problems.append('missing %r section' % key)
+    for key in ('rps', 'error_rate'):
+        if isinstance(report.get(key), bool) or not isinstance(report.get(key), (int, float)):
+            problems.append('missing %r value' % key)
+    for endpoint, stats in (report.get('endpoints') or {}).items():
+        if not isinstance(stats, dict) or not all(k in stats for k in ('rps', 'error_rate', 'latency_ms')):
+            problems.append('incomplete statistics for %s' % endpoint)
+    return problems
+
+
+def compare_reports(current, baseline, threshold,
+                    latency_tolerance=DEFAULT_LATENCY_TOLERANCE_MS):
+    """Compare throughput, error rate and p95 latency against a saved baseline report
+
+    A p95 rise only counts when it exceeds both the percentage threshold and
+    latency_tolerance milliseconds, and is skipped as inconclusive when either
+    side has fewer than MIN_P95_SAMPLES samples per run.
+    """
+    regressions = []
+    lines = []
+
+    def check(label, old, new):
+        rps_change = (new['rps'] - old['rps']) / old['rps'] * 100 if old['rps'] else 0.0
+        line = '  %-26s rps %8.2f -> %8.2f (%+6.1f%%)' % (label, old['rps'], new['rps'], rps_change)
+        if rps_change < -threshold:
+            regressions.append('%s throughput down %.1f%%' % (label, -rps_change))
+
+        # Any new error is a regression; existing errors may grow up to the threshold
+        old_errors, new_errors = old['error_rate'], new['error_rate']
+        line += '   errors %6.2f%% -> %6.2f%%' % (old_errors * 100, new_errors * 100)
+        if new_errors > old_errors and (
+                not old_errors or (new_errors - old_errors) / old_errors * 100 > threshold):
+            regressions.append('%s error rate up from %.2f%% to %.2f%%' % (
+                label, old_errors * 100, new_errors * 100))
+
+        old_latency, new_latency = old.get('latency_ms'), new.get('latency_ms')
+        if old_latency and new_latency:
+            old_p95, new_p95 = old_latency['p95'], new_latency['p95']
+            p95_change = (new_p95 - old_p95) / old_p95 * 100 if old_p95 else 0.0
+            line += '   p95 %8.2f -> %8.2f ms (%+6.1f%%)' % (old_p95, new_p95, p95_change)
+            samples = min(old.get('latency_samples', 0), new.get('latency_samples', 0))
+            if samples < MIN_P95_SAMPLES:
+                line += ' inconclusive (%d samples)' % samples
+            elif p95_change > threshold and new_p95 - old_p95 > latency_tolerance:
+                regressions.append('%s p95 latency up %.1f%% (%+.2f ms)' % (
+                    label, p95_change, new_p95 - old_p95))
+        elif old_latency:
+            line += '   p95 %8.2f ->        - ms' % old_latency['p95']
+        lines.append(line)
+
+    check('overall', baseline, current)
+    for endpoint in ENDPOINTS:
+        old = baseline['endpoints'].get(endpoint)
+        new = current['endpoints'].get(endpoint)
+        if old and new:
+            check(endpoint, old, new)
+        elif old:
+            lines.append('  %-26s missing from current run' % endpoint)
+            regressions.append('%s missing from current run' % endpoint)
+    return lines, regressions
+
+
+def scenario_differences(current, baseline):
+    """List workload settings that differ between two scenarios"""
+    differences = []
+    for key in sorted(set(current) | set(baseline)):
+        if key in ('name', 'target'):
+            continue
+        if current.get(key) != baseline.get(key):
+            differences.append('%s: baseline %r, current %r' % (
+                key, baseline.get(key), current.get(key)))
+    return differences
+
+
+def print_report(report):
+    scenario = report['scenario']
+    print("Scenario: %s (target: %s)" % (scenario['name'], scenario['target']))
+    print("Sessions: %d, iterations: %d, resumes/batch: %d, words/resume: %d" % (
+        scenario['sessions'], scenario['iterations'],
+        scenario['resumes_per_batch'], scenario['resume_words']))
+    print("Duration: %.2fs, requests: %d of %d planned completed, %d successful" % (
+        report['duration_s'], report['completed_requests'], report['planned_requests'],
+        report['successful_requests']))
+    if report.get('runs', 1) > 1:
+        print("Runs: %d (req/s and latency are medians across runs)" % report['runs'])
+    print("Throughput: %.2f successful req/s, error rate: %.2f%%" % (
+        report['rps'], report['error_rate'] * 100))
+    print("Req/s and latency (ms) below count successful requests only")
+    print("")
+    print("%-26s %6s %6s %8s %8s %8s %8s %8s %8s" % (
+        'Endpoint', 'Reqs', 'OK', 'Req/s', 'p50', 'p90', 'p95', 'p99', 'Errors'))
+    for endpoint, stats in report['endpoints'].items():
+        latency = stats['latency_ms']
+        if latency:
+            percentiles = "%8.1f %8.1f %8.1f %8.1f" % (
+                latency['p50'], latency['p90'], latency['p95'], latency['p99'])
+        else:
+            percentiles = "%8s %8s %8s %8s" % ('-', '-', '-', '-')
+        print("%-26s %6d %6d %8.2f %s %7.1f%%" % (
+            endpoint, stats['requests'], stats['successful'], stats['rps'], percentiles,
+            stats['error_rate'] * 100))
+        if stats['errors']:
+            print("    errors: %s" % ', '.join('%s x%d' % item for item in stats['errors'].items()))
+    if report.get('memory'):
+        memory = report['memory']
+        print("")
+        processes = memory.get('processes', {})
+        print("%s memory (RSS, total of %d process%s): before load %.1f MB, end %.1f MB, "
+              "peak %.1f MB (growth %+.1f MB)" % (
+                  memory['process'].capitalize(), len(processes),
+                  '' if len(processes) == 1 else 'es', memory['baseline_mb'],
+                  memory['end_mb'], memory['peak_mb'], memory['growth_mb']))
+        if len(processes) > 1:
+            for pid, stats in processes.items():
+                print("    pid %s: before load %.1f MB, end %.1f MB, peak %.1f MB" % (
+                    pid, stats['baseline_mb'], stats['end_mb'], stats['peak_mb']))
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description='Concurrent load test for the resume matching endpoints')
+    parser.add_argument('--scenario', help='Path to a saved scenario JSON file')
+    parser.add_argument('--target', help="'local' for the in-process test client, or a server URL")
+    parser.add_argument('--sessions', type=int, help='Number of concurrent recruiter sessions')
+    parser.add_argument('--iterations', type=int, help='Resume batches uploaded per session')
+    parser.add_argument('--resumes-per-batch', type=int, help='Resumes in each uploaded batch')
+    parser.add_argument('--resume-words', type=int, help='Approximate words per generated resume')
+    parser.add_argument('--think-time', type=float, help='Seconds to pause between batches')
+    parser.add_argument('--pid', type=int, action='append',
+                        help='Server PID to sample memory from, including its child processes '
+                             '(repeat for several processes)')
+    parser.add_argument('--save', help='Write the JSON report to this path')
+    parser.add_argument('--compare', help='Baseline JSON report to compare against')
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help='Allowed regression in percent before failing (default: 10)')
+    parser.add_argument('--latency-tolerance', type=float, default=DEFAULT_LATENCY_TOLERANCE_MS,
+                        help='Allowed p95 latency rise in ms before failing (default: %g)'
+                        % DEFAULT_LATENCY_TOLERANCE_MS)
+    parser.add_argument('--repeat', type=int, default=1,
+                        help='Run the scenario N times and report medians (default: 1)')
+    parser.add_argument('--no-warmup', action='store_true',
+                        help='Skip the unmeasured warm-up pass')
+    args = parser.parse_args()
+
+    scenario = load_scenario(args.scenario, {
+        'target': args.target,
+        'sessions': args.sessions,
+        'iterations': args.iterations,
+        'resumes_per_batch': args.resumes_per_batch,
+        'resume_words': args.resume_words,
+        'think_time': args.think_time
+    })
+    problems = validate_scenario(scenario)
+    if args.repeat < 1:
+        problems.append('--repeat must be at least 1 (got %d)' % args.repeat)
+    if args.latency_tolerance < 0:
+        problems.append('--latency-tolerance must not be negative (got %g)' % args.latency_tolerance)
+    if args.pid and scenario['target'] == 'local':
+        problems.append('--pid only applies to a server target; local mode samples the harness itself')
+    for pid in args.pid or []:
+        if read_rss_kb(pid) is None:
+            problems.append('no readable process with PID %d' % pid)
+    if problems:
+        parser.error('; '.join(problems))
+
+    baseline = None
+    if args.compare:
+        try:
+            with open(args.compare, encoding='utf-8') as f:
+                baseline = json.load(f)
+        except (OSError, ValueError) as e:
+            parser.error('cannot read baseline %s: %s' % (args.compare, e))
+        problems = validate_report(baseline)
+        if problems:
+            parser.error('baseline %s is not a load test report (%s)' % (
+                args.compare, '; '.join(problems)))
+        differences = scenario_differences(scenario, baseline['scenario'])
+        if differences:
+            parser.error('baseline %s was run with a different scenario (%s)' % (
+                args.compare, '; '.join(differences)))
+
+    if scenario['target'] == 'local':
+        from app import app
+        app.config['TESTING'] = True
+        session_factory = lambda: LocalSession(app)
+        # In-process mode shares one process with the harness and its test clients
+        pids = [os.getpid()]
+        memory_label = 'harness+app process'
+    else:
+        session_factory = lambda: HttpSession(scenario['target'])
+        pids = args.pid
+        memory_label = 'server'
+
+    sampler = MemorySampler(pids, memory_label) if pids else None
+    if sampler:
+        sampler.start()
+
+    load_test = LoadTest(scenario, session_factory)
+    if not args.no_warmup:
+        load_test.warmup()
+
+    reports = []
+    for _ in range(args.repeat):
+        duration = load_test.run()
+        reports.append(load_test.report(duration))
+    report = combine_reports(reports)
+    if sampler:
+        sampler.stop()
+        report['memory'] = sampler.summary()
+    print_report(report)
+
+    if args.save:
+        save_dir = os.path.dirname(args.save)
+        if save_dir:
+            os.makedirs(save_dir, exist_ok=True)
+        with open(args.save, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print("\nReport saved to %s" % args.save)
+
+    if baseline:
+        lines, regressions = compare_reports(report, baseline, args.threshold,
+                                              args.latency_tolerance)
+        print("\nComparison with %s:" % args.compare)
+        print('\n'.join(lines))
+        if regressions:
+            print("\nRegressions (threshold %.1f%%, %g ms):" % (
+                args.threshold, args.latency_tolerance))
+            for regression in regressions:
+                print("  ✗ " + regression)
+            return 1
+        print("\n✓ No regressions beyond %.1f%%" % args.threshold)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,188 @@
+from load_test import (
+    DEFAULT_SCENARIO,
+    MIN_P95_SAMPLES,
+    ResumeGenerator,
+    combine_reports,
+    compare_reports,
+    percentile,
+    scenario_differences,
+    validate_report,
+    validate_scenario,
+)
+
+
+def make_endpoint(rps=10.0, error_rate=0.0, p95=100.0, samples=50, errors=None):
+    latency = None
+    if p95 is not None:
+        latency = {'mean': p95, 'p50': p95, 'p90': p95, 'p95': p95, 'p99': p95, 'max': p95}
+    return {
+        'requests': samples,
+        'successful': samples,
+        'latency_samples': samples,
+        'rps': rps,
+        'error_rate': error_rate,
+        'errors': errors or {},
+        'latency_ms': latency
+    }
+
+
+def make_report(rps=30.0, error_rate=0.0, **endpoint_overrides):
+    return {
+        'scenario': dict(DEFAULT_SCENARIO),
+        'runs': 1,
+        'duration_s': 1.0,
+        'planned_requests': 150,
+        'completed_requests': 150,
+        'successful_requests': 150,
+        'rps': rps,
+        'error_rate': error_rate,
+        'endpoints': {
+            '/upload_job_description': make_endpoint(**endpoint_overrides),
+            '/upload_resumes': make_endpoint(**endpoint_overrides),
+            '/export_csv': make_endpoint(**endpoint_overrides)
+        }
+    }
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 95) == 95
+    assert percentile(values, 100) == 100
+    assert percentile([7], 95) == 7
+    assert percentile([], 95) == 0.0
+
+
+def test_percentile_small_sample_is_maximum():
+    assert percentile(list(range(1, MIN_P95_SAMPLES)), 95) == MIN_P95_SAMPLES - 1
+
+
+def test_compare_identical_reports_has_no_regressions():
+    lines, regressions = compare_reports(make_report(), make_report(), 10)
+    assert regressions == []
+    assert len(lines) == 4
+
+
+def test_compare_flags_throughput_drop():
+    _, regressions = compare_reports(make_report(rps=20.0), make_report(rps=30.0), 10)
+    assert regressions == ['overall throughput down 33.3%']
+
+
+def test_compare_zero_rps_baseline():
+    _, regressions = compare_reports(make_report(rps=5.0), make_report(rps=0.0), 10)
+    assert regressions == []
+
+
+def test_compare_flags_new_errors():
+    current = make_report(rps=60.0, error_rate=0.01)
+    current['endpoints']['/export_csv'] = make_endpoint(error_rate=0.01, errors={'500': 1})
+    _, regressions = compare_reports(current, make_report(), 10)
+    assert 'overall error rate up from 0.00% to 1.00%' in regressions
+    assert '/export_csv error rate up from 0.00% to 1.00%' in regressions
+
+
+def test_compare_allows_error_growth_within_threshold():
+    _, regressions = compare_reports(make_report(error_rate=0.105), make_report(error_rate=0.1), 10)
+    assert regressions == []
+    _, regressions = compare_reports(make_report(error_rate=0.2), make_report(error_rate=0.1), 10)
+    assert regressions == ['overall error rate up from 10.00% to 20.00%']
+
+
+def test_compare_flags_endpoint_missing_from_current_run():
+    current = make_report()
+    del current['endpoints']['/upload_resumes']
+    lines, regressions = compare_reports(current, make_report(), 10)
+    assert regressions == ['/upload_resumes missing from current run']
+    assert any('missing from current run' in line for line in lines)
+
+
+def test_compare_latency_needs_percentage_and_absolute_rise():
+    # +50% but only +5 ms: within the default 10 ms tolerance
+    _, regressions = compare_reports(make_report(p95=15.0), make_report(p95=10.0), 10)
+    assert regressions == []
+    _, regressions = compare_reports(make_report(p95=150.0), make_report(p95=100.0), 10)
+    assert len(regressions) == 3
+    assert regressions[0] == '/upload_job_description p95 latency up 50.0% (+50.00 ms)'
+    _, regressions = compare_reports(make_report(p95=15.0), make_report(p95=10.0), 10,
+                                     latency_tolerance=1.0)
+    assert len(regressions) == 3
+
+
+def test_compare_marks_small_samples_inconclusive():
+    current = make_report(p95=500.0, samples=MIN_P95_SAMPLES - 1)
+    lines, regressions = compare_reports(current, make_report(p95=100.0), 10)
+    assert regressions == []
+    assert all('inconclusive' in line for line in lines[1:])
+
+
+def test_compare_without_successful_requests():
+    current = make_report(rps=0.0, error_rate=1.0, p95=None)
+    for stats in current['endpoints'].values():
+        stats['rps'], stats['error_rate'] = 0.0, 1.0
+    _, regressions = compare_reports(current, make_report(), 10)
+    assert 'overall throughput down 100.0%' in regressions
+    assert 'overall error rate up from 0.00% to 100.00%' in regressions
+    assert not any('p95' in regression for regression in regressions)
+
+
+def test_combine_reports_takes_medians_and_pools_counts():
+    reports = [make_report(rps=rps, p95=p95) for rps, p95 in ((10.0, 90.0), (30.0, 300.0), (20.0, 100.0))]
+    reports[1]['endpoints']['/export_csv'] = make_endpoint(error_rate=0.02, errors={'500': 1}, samples=50)
+    combined = combine_reports(reports)
+    assert combined['runs'] == 3
+    assert combined['rps'] == 20.0
+    assert combined['planned_requests'] == 450
+    export = combined['endpoints']['/export_csv']
+    assert export['errors'] == {'500': 1}
+    assert export['requests'] == 150
+    assert export['latency_ms']['p95'] == 100.0
+    assert combined['endpoints']['/upload_resumes']['latency_ms']['p95'] == 100.0
+
+
+def test_combine_single_report_is_unchanged():
+    report = make_report()
+    assert combine_reports([report]) is report
+
+
+def test_scenario_differences_ignores_name_and_target():
+    baseline = dict(DEFAULT_SCENARIO)
+    current = dict(DEFAULT_SCENARIO, name='other', target='http://localhost:8000')
+    assert scenario_differences(current, baseline) == []
+    current['sessions'] = 8
+    assert scenario_differences(current, baseline) == ['sessions: baseline 4, current 8']
+
+
+def test_validate_scenario_accepts_defaults():
+    assert validate_scenario(dict(DEFAULT_SCENARIO)) == []
+
+
+def test_validate_scenario_rejects_bad_values():
+    scenario = dict(DEFAULT_SCENARIO, sessions=0, iterations=True, resumes_per_batch=2.5,
+                    resume_words=-1, think_time=-0.5, seed='1')
+    problems = validate_scenario(scenario)
+    assert len(problems) == 6
+    assert problems[0] == 'sessions must be a positive integer (got 0)'
+    assert 'iterations must be a positive integer (got True)' in problems
+    assert 'resumes_per_batch must be a positive integer (got 2.5)' in problems
+
+
+def test_validate_scenario_accepts_float_think_time():
+    assert validate_scenario(dict(DEFAULT_SCENARIO, think_time=0.25)) == []
+    assert validate_scenario(dict(DEFAULT_SCENARIO, think_time=False)) != []
+
+
+def test_validate_report():
+    assert validate_report(make_report()) == []
+    assert validate_report([]) == ['expected a JSON object saved with --save']
+    assert validate_report(dict(DEFAULT_SCENARIO)) == [
+        "missing 'scenario' section", "missing 'endpoints' section",
+        "missing 'rps' value", "missing 'error_rate' value"]
+    report = make_report()
+    del report['endpoints']['/export_csv']['latency_ms']
+    assert validate_report(report) == ['incomplete statistics for /export_csv']
+
+
+def test_resume_batches_are_reproducible():
+    first = ResumeGenerator(3).batch(4, 50)
+    assert first == ResumeGenerator(3).batch(4, 50)
+    assert first != ResumeGenerator(4).batch(4, 50)